@@ -38,9 +38,10 @@
 #
 #   Currently implemented:
 #     - Bucket enumeration
-#     - Topic enumeration and inspection
+#     - Topic enumeration, inspection and lookup by name
 #     - AMQP topic creation
-#     - Bucket notification creation and removal
+#     - Bucket notification creation (single or batched) and removal
+#     - Parallel notification listing/removal across many buckets
 #
 #   Extensibility:
 #     - Additional notification transports (Kafka, HTTP/S, etc.) can be added
@@ -48,19 +49,304 @@
 #
 #   Error Handling:
 #     - This module intentionally returns raw API responses serialized as JSON
-#       strings (including error responses).
+#       strings (including error responses). Construct the manager with
+#       return_raw=True to receive the response dicts directly instead.
+#     - Throttling and transient server errors are retried by botocore
+#       (adaptive mode) before an error is returned.
+#     - API errors are returned as {"error": {...}, "http_status": N} using
+#       the service's own error code and message; other failures are
+#       returned as {"error": "<message>"}.
 #     - Exceptions are not raised to support interactive scripting and
 #       inspection of Ceph/S3 API behavior.
 #
 #   Security:
-#     - TLS verification and credential handling are intentionally delegated
-#       to the calling script or execution environment.
+#     - TLS certificates of the RGW endpoint are verified by default. Pass
+#       ca_bundle to trust a private CA, or verify_tls=False for
+#       self-signed lab deployments. (The verify_ssl/ca_location arguments
+#       of create_amqp_topic configure the AMQP broker connection instead.)
+#     - Credential handling is intentionally delegated to the calling script
+#       or execution environment.
 #
 # -----------------------------------------------------------------------------
 
-import boto3
-from botocore.client import Config
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# orjson is optional; when installed it is used for faster JSON encoding.
+# Datetimes and layout are the same with or without it; the only
+# difference is that orjson writes non-ASCII text as UTF-8 rather than
+# \uXXXX escapes.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# boto3/botocore are imported on first use (see _lazy_import) to keep
+# importing this module cheap for scripts that only issue a single call.
+boto3 = None
+Config = None
+ClientError = None
+RefreshableCredentials = None
+_IMPORT_LOCK = threading.Lock()
+
+
+# ------------------------------------------------------------
+# Helper: Import boto3 on first use
+# ------------------------------------------------------------
+def _lazy_import():
+    """
+    Import boto3 and botocore into module globals if not already loaded.
+
+    Safe to call from several threads: the import runs under a lock, and
+    boto3 (the "already loaded" marker) is assigned last so no thread can
+    see it set while the other names are still None.
+    """
+    global boto3, Config, ClientError, RefreshableCredentials
+
+    if boto3 is not None:
+        return
+
+    with _IMPORT_LOCK:
+        if boto3 is None:
+            import boto3 as _boto3
+            from botocore.client import Config as _Config
+            from botocore.credentials import (
+                RefreshableCredentials as _RefreshableCredentials)
+            from botocore.exceptions import ClientError as _ClientError
+            Config = _Config
+            ClientError = _ClientError
+            RefreshableCredentials = _RefreshableCredentials
+            boto3 = _boto3
+
+
+# Lifetime (seconds) of cached topic responses. Kept short so that changes
+# made outside this manager become visible quickly.
+_TOPIC_CACHE_TTL = 10
+_TOPIC_CACHE_SIZE = 256
+
+# Cache key used for the full list_topics response
+_TOPIC_LIST_KEY = ('list_topics',)
+
+# Fixed attributes shared by every AMQP topic
+_BASE_AMQP_ATTRS = {
+    'amqp-ack-level': 'broker',
+    'use-ssl': 'true'
+}
+
+_BOOL_STR = {True: 'true', False: 'false'}
+
+# Events emitted by notifications created with create_notification
+_NOTIF_EVENTS = ('s3:ObjectCreated:*', 's3:ObjectRemoved:*')
+
+# Sections of a bucket notification configuration that an empty PUT clears.
+# Rule lists count when non-empty; EventBridgeConfiguration is enabled by
+# its mere presence (its value is an empty dict).
+_NOTIF_CONFIG_KEYS = (
+    'TopicConfigurations',
+    'QueueConfigurations',
+    'LambdaFunctionConfigurations'
+)
+_NOTIF_EVENTBRIDGE_KEY = 'EventBridgeConfiguration'
+
+# HTTP connections kept per client. Bulk helpers should not use more
+# worker threads than this, or requests will queue for a connection.
+_MAX_POOL_CONNECTIONS = 20
+_BULK_MAX_WORKERS = 16
+
+# Retry and timeout policy (seconds) applied to every API call
+_RETRY_MAX_ATTEMPTS = 5
+_CONNECT_TIMEOUT = 3
+_READ_TIMEOUT = 10
+
+
+# ------------------------------------------------------------
+# Helper: Small time-bounded response cache
+# ------------------------------------------------------------
+class _TTLCache:
+    """
+    Minimal size- and time-bounded cache for idempotent API responses.
+
+    Entries expire ttl seconds after being stored. When the cache is full
+    the oldest entry is evicted. All operations are guarded by a lock so a
+    cache can be shared between threads.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                self._data.pop(key, None)
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+# ------------------------------------------------------------
+# Helper: Copy the dicts and lists of an API response
+# ------------------------------------------------------------
+def _copy_containers(obj):
+    """
+    Copy nested dicts and lists, sharing the (immutable) leaf values.
+    """
+    if isinstance(obj, dict):
+        return {k: _copy_containers(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_containers(v) for v in obj]
+    return obj
+
+
+# ------------------------------------------------------------
+# Helper: Resolve profile credentials once
+# ------------------------------------------------------------
+def _resolve_profile_credentials(session):
+    """
+    Resolve a profile session's credentials once, at construction time.
+
+    Static credentials are frozen and returned as explicit client keyword
+    arguments so the profile/config files are not consulted again.
+    Refreshable credentials (SSO, assume-role, etc.) are left with the
+    session so they can still be renewed when they expire.
+
+    Returns:
+        dict: Keyword arguments for session.client()
+    """
+    creds = session.get_credentials()
+    if creds is None or isinstance(creds, RefreshableCredentials):
+        return {}
+
+    frozen = creds.get_frozen_credentials()
+    return {
+        'aws_access_key_id': frozen.access_key,
+        'aws_secret_access_key': frozen.secret_key,
+        'aws_session_token': frozen.token
+    }
+
+
+# ------------------------------------------------------------
+# Helper: Build (and memoize) boto3 clients
+# ------------------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def _build_clients(endpoint, access_key, secret_key, region, aws_profile,
+                   verify_tls=True, ca_bundle=''):
+    """
+    Build the S3 and SNS clients for a given endpoint and credential set.
+
+    Client construction is comparatively expensive (endpoint data, loaders
+    and the credential chain are all resolved), so results are memoized and
+    reused by every manager created with the same arguments. boto3 clients
+    are safe to share for API calls.
+
+    TLS verification is controlled by verify_tls; when enabled, ca_bundle
+    may name a CA bundle to use instead of the default trust store.
+
+    Returns:
+        tuple: (s3_client, sns_client)
+    """
+    verify = (ca_bundle or True) if verify_tls else False
+
+    # A single session and Config are shared by both clients so credential
+    # resolution happens once and both clients keep warm keep-alive
+    # connections to the same RGW endpoint. Adaptive retries absorb
+    # throttling and transient 5xx responses before they reach the caller.
+    config = Config(
+        signature_version="s3v4",
+        max_pool_connections=_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={
+            'max_attempts': _RETRY_MAX_ATTEMPTS,
+            'mode': 'adaptive'
+        },
+        connect_timeout=_CONNECT_TIMEOUT,
+        read_timeout=_READ_TIMEOUT
+    )
+
+    if aws_profile:
+        session = boto3.Session(profile_name=aws_profile)
+        client_kwargs = _resolve_profile_credentials(session)
+    else:
+        session = boto3.Session()
+        client_kwargs = {
+            'aws_access_key_id': access_key,
+            'aws_secret_access_key': secret_key,
+            'region_name': region
+        }
+
+    s3 = session.client(
+        "s3",
+        endpoint_url=endpoint,
+        config=config,
+        use_ssl=True,
+        verify=verify,
+        **client_kwargs
+    )
+
+    sns = session.client(
+        "sns",
+        endpoint_url=endpoint,
+        config=config,
+        use_ssl=True,
+        verify=verify,
+        **client_kwargs
+    )
+
+    return s3, sns
+
+
+class NotificationRule:
+    """
+    A single bucket notification rule.
+
+    Rules are converted to API dicts only when submitted, keeping large
+    in-process rule sets compact (__slots__, no per-instance dict).
+
+    Attributes:
+        id (str): Identifier for the notification rule
+        topic_arn (str): ARN of the notification topic
+        events (tuple): S3 event types to emit (default: object create
+            and delete events)
+    """
+
+    __slots__ = ('id', 'topic_arn', 'events')
+
+    def __init__(self, id, topic_arn, events=_NOTIF_EVENTS):
+        self.id = id
+        self.topic_arn = topic_arn
+        self.events = events
+
+    def __repr__(self):
+        return (f"NotificationRule(id={self.id!r}, "
+                f"topic_arn={self.topic_arn!r}, events={self.events!r})")
+
+    def __eq__(self, other):
+        if not isinstance(other, NotificationRule):
+            return NotImplemented
+        return ((self.id, self.topic_arn, self.events) ==
+                (other.id, other.topic_arn, other.events))
 
 
 class CephNotificationMgr:
@@ -75,7 +361,8 @@ class CephNotificationMgr:
     """
 
     def __init__(self, endpoint='', access_key='', secret_key='',
-                 region="us-east-1", aws_profile=''):
+                 region="us-east-1", aws_profile='', return_raw=False,
+                 verify_tls=True, ca_bundle=''):
         """
         Initialize the notification manager.
 
@@ -89,104 +376,264 @@ class CephNotificationMgr:
             secret_key (str): S3 secret key (ignored if aws_profile is set)
             region (str): AWS region name (default: us-east-1)
             aws_profile (str): AWS CLI profile name to use
+            return_raw (bool): Return API responses as Python dicts instead
+                of JSON strings (default: False). Useful when the caller
+                would otherwise parse the JSON straight back into a dict.
+            verify_tls (bool): Verify the RGW endpoint's TLS certificate
+                (default: True)
+            ca_bundle (str): Optional CA bundle path used to verify the
+                RGW endpoint
         """
 
-        if aws_profile:
-            session = boto3.Session(profile_name=aws_profile)
+        self.return_raw = return_raw
 
-            self.s3 = session.client(
-                "s3",
-                endpoint_url=endpoint,
-                config=Config(signature_version="s3v4"),
-                use_ssl=True,
-                verify=False
-            )
+        _lazy_import()
+        self.s3, self.sns = _build_clients(endpoint, access_key, secret_key,
+                                           region, aws_profile,
+                                           verify_tls, ca_bundle)
 
-            self.sns = session.client(
-                "sns",
-                endpoint_url=endpoint,
-                config=Config(signature_version="s3v4"),
-                use_ssl=True,
-                verify=False
-            )
-        else:
-            self.s3 = boto3.client(
-                "s3",
-                endpoint_url=endpoint,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region,
-                config=Config(signature_version="s3v4"),
-                use_ssl=True,
-                verify=False
-            )
+        self._topic_cache = _TTLCache(_TOPIC_CACHE_SIZE, _TOPIC_CACHE_TTL)
 
-            self.sns = boto3.client(
-                "sns",
-                endpoint_url=endpoint,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region,
-                config=Config(signature_version="s3v4"),
-                use_ssl=True,
-                verify=False
-            )
+        # Topic name -> ARN, populated on first topic_arn() lookup
+        self._arn_by_name = None
+        self._arn_loaded_at = 0.0
+        self._arn_lock = threading.Lock()
 
     # --------------------------------------------------------
     # Helper: Convert API responses to JSON
     # --------------------------------------------------------
-    def _to_json(self, obj):
+    def _to_json(self, obj, pretty=True, stream=None):
         """
         Convert a Python object into a JSON-formatted string.
 
         This helper normalizes boto3 responses (including datetime objects)
-        into JSON for easier inspection and logging.
+        into JSON for easier inspection and logging. When return_raw is
+        enabled the object is returned unchanged and no encoding is done,
+        unless a stream is given, in which case the JSON is still written
+        to it.
+
+        orjson is used for string output when available, falling back to
+        the standard json module for objects orjson cannot encode. Streamed
+        output always uses json.dump so it is written incrementally.
 
         Parameters:
             obj (any): Python object to serialize
+            pretty (bool): Indent the output (default: True). Compact output
+                is cheaper to produce for large responses.
+            stream (file): Optional writable text stream. When provided the
+                JSON is written directly to it instead of being returned.
 
         Returns:
-            str: Pretty-printed JSON string
+            str: JSON string, or '' when written to stream
+            dict: The unmodified object when return_raw is enabled and no
+                stream is given
         """
+        if self.return_raw and stream is None:
+            return obj
+
         try:
+            if stream is not None:
+                json.dump(obj, stream, default=str,
+                          indent=2 if pretty else None)
+                return ''
+            if orjson is not None:
+                # Datetimes are passed through to default=str so the output
+                # matches the json module exactly.
+                option = orjson.OPT_PASSTHROUGH_DATETIME
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                try:
+                    return orjson.dumps(obj, default=str,
+                                        option=option).decode()
+                except orjson.JSONEncodeError:
+                    # e.g. non-str dict keys or integers beyond 64 bits,
+                    # which the json module handles
+                    pass
+            if not pretty:
+                return json.dumps(obj, default=str, separators=(',', ':'))
             return json.dumps(obj, indent=2, default=str)
         except Exception as e:
             return json.dumps({"error": f"JSON encode failed: {e}"}, indent=2)
 
+    # --------------------------------------------------------
+    # Helper: Copy a cached response for the caller
+    # --------------------------------------------------------
+    def _uncached(self, resp):
+        """
+        Return a response that is safe to hand to the caller.
+
+        In return_raw mode the caller receives the dict itself, so the
+        dicts and lists of a cached response are copied to keep later cache
+        hits (and other users of a shared manager) unaffected by caller
+        modifications. Leaf values (str, int, datetime) are immutable and
+        shared. This is several times cheaper than copy.deepcopy. JSON
+        output never exposes the cached object, so no copy is made.
+
+        Parameters:
+            resp (dict): Response stored in the topic cache
+
+        Returns:
+            dict: resp, or a copy of it in return_raw mode
+        """
+        if self.return_raw:
+            return _copy_containers(resp)
+        return resp
+
+    # --------------------------------------------------------
+    # Helper: Describe a botocore ClientError
+    # --------------------------------------------------------
+    def _client_error(self, e):
+        """
+        Build an error dict from a botocore ClientError.
+
+        The service's error details are already parsed into a dict, so
+        they are returned as-is together with the HTTP status, letting
+        callers tell throttling or server errors from permanent failures.
+
+        Parameters:
+            e (ClientError): Exception raised by a boto3 client call
+
+        Returns:
+            dict: {'error': {...}, 'http_status': int}
+        """
+        return {
+            'error': e.response.get('Error', {}),
+            'http_status': e.response.get(
+                'ResponseMetadata', {}).get('HTTPStatusCode')
+        }
+
     # --------------------------------------------------------
     # LIST ALL BUCKETS
     # --------------------------------------------------------
-    def list_buckets(self):
+    def list_buckets(self, pretty=True, stream=None):
         """
         List all buckets visible to the authenticated user.
 
+        Parameters:
+            pretty (bool): Indent the JSON output (default: True)
+            stream (file): Optional text stream to write the JSON to
+
         Returns:
             str: JSON-formatted response from the S3 API
         """
         try:
             resp = self.s3.list_buckets()
-            return self._to_json(resp)
+            return self._to_json(resp, pretty, stream)
+        except ClientError as e:
+            return self._to_json(self._client_error(e), pretty, stream)
         except Exception as e:
-            return self._to_json({"error": str(e)})
+            return self._to_json({"error": str(e)}, pretty, stream)
+
+    # --------------------------------------------------------
+    # Helper: Fetch every topic across all pages
+    # --------------------------------------------------------
+    def _fetch_topics(self):
+        """
+        Return every topic from the SNS API, following pagination.
+
+        Returns:
+            list: Topic dicts (each with a 'TopicArn' key)
+        """
+        paginator = self.sns.get_paginator('list_topics')
+        topics = []
+        for page in paginator.paginate():
+            topics.extend(page.get('Topics', []))
+        return topics
+
+    # --------------------------------------------------------
+    # Helper: Rebuild the topic name -> ARN cache
+    # --------------------------------------------------------
+    def _refresh_arn_cache(self):
+        """
+        Reload the topic name -> ARN mapping from the SNS API.
+
+        Callers must hold self._arn_lock.
+
+        API errors are propagated to the caller; the existing mapping is
+        left untouched if the reload fails.
+        """
+        self._arn_by_name = {
+            t['TopicArn'].rsplit(':', 1)[-1]: t['TopicArn']
+            for t in self._fetch_topics()
+        }
+        self._arn_loaded_at = time.monotonic()
 
     # --------------------------------------------------------
     # LIST ALL TOPICS
     # --------------------------------------------------------
-    def list_topics(self):
+    def list_topics(self, pretty=True, stream=None):
         """
         List all notification topics.
 
         In Ceph RGW, topics are typically used as push-notification targets
         (e.g., AMQP exchanges).
 
+        Results are paginated internally so that every topic is returned,
+        not only the first page (SNS returns at most 100 topics per call).
+        Successful responses are cached briefly (see _TOPIC_CACHE_TTL).
+
+        Parameters:
+            pretty (bool): Indent the JSON output (default: True)
+            stream (file): Optional text stream to write the JSON to
+
         Returns:
-            str: JSON-formatted response from the SNS API
+            str: JSON-formatted list of topics from the SNS API
         """
         try:
-            resp = self.sns.list_topics()
-            return self._to_json(resp)
+            # Topics are cached as tuples of (key, value) pairs, which the
+            # caller can't modify; a fresh dict per topic is built per call.
+            topics = self._topic_cache.get(_TOPIC_LIST_KEY)
+            if topics is None:
+                topics = tuple(tuple(t.items())
+                               for t in self._fetch_topics())
+                self._topic_cache.set(_TOPIC_LIST_KEY, topics)
+            resp = {'Topics': [dict(t) for t in topics]}
+            return self._to_json(resp, pretty, stream)
+        except ClientError as e:
+            return self._to_json(self._client_error(e), pretty, stream)
         except Exception as e:
-            return self._to_json({"error": str(e)})
+            return self._to_json({"error": str(e)}, pretty, stream)
+
+    # --------------------------------------------------------
+    # LOOK UP A TOPIC ARN BY NAME
+    # --------------------------------------------------------
+    def topic_arn(self, name):
+        """
+        Look up the ARN of a notification topic by name.
+
+        The name -> ARN mapping is loaded from list_topics on first use and
+        kept up to date by create_amqp_topic and delete_topic, so repeated
+        lookups do not rescan every topic. A name that is not found triggers
+        a reload (in case the topic was created elsewhere) at most once per
+        _TOPIC_CACHE_TTL seconds, so repeated misses stay cheap.
+
+        Parameters:
+            name (str): Topic name
+
+        Unlike the other methods, the result is meant to be passed straight
+        to calls such as create_notification, so it is never an error
+        document: if the topic listing fails, the error is logged and None
+        is returned.
+
+        Returns:
+            str: Topic ARN, or None if the topic was not found or the
+                listing failed
+        """
+        try:
+            with self._arn_lock:
+                if self._arn_by_name is None or (
+                        name not in self._arn_by_name and
+                        time.monotonic() - self._arn_loaded_at
+                        >= _TOPIC_CACHE_TTL):
+                    self._refresh_arn_cache()
+                return self._arn_by_name.get(name)
+        except ClientError as e:
+            log.error("topic_arn(%r): topic listing failed: %s",
+                      name, self._client_error(e))
+            return None
+        except Exception as e:
+            log.error("topic_arn(%r): topic listing failed: %s", name, e)
+            return None
 
     # --------------------------------------------------------
     # GET A TOPIC
@@ -195,6 +642,8 @@ class CephNotificationMgr:
         """
         Retrieve attributes for a specific notification topic.
 
+        Successful responses are cached briefly (see _TOPIC_CACHE_TTL).
+
         Parameters:
             topic_arn (str): ARN of the topic
 
@@ -202,8 +651,13 @@ class CephNotificationMgr:
             str: JSON-formatted topic attributes
         """
         try:
-            resp = self.sns.get_topic_attributes(TopicArn=topic_arn)
-            return self._to_json(resp)
+            resp = self._topic_cache.get(topic_arn)
+            if resp is None:
+                resp = self.sns.get_topic_attributes(TopicArn=topic_arn)
+                self._topic_cache.set(topic_arn, resp)
+            return self._to_json(self._uncached(resp))
+        except ClientError as e:
+            return self._to_json(self._client_error(e))
         except Exception as e:
             return self._to_json({"error": str(e)})
 
@@ -222,19 +676,18 @@ class CephNotificationMgr:
             exchange (str): AMQP exchange name
             topic_name (str): Ceph/SNS topic name
             amqp_uri (str): AMQP endpoint URI (host:port/vhost)
-            ca_location (str): Optional CA certificate path
-            verify_ssl (bool): Whether to verify TLS certificates
+            ca_location (str): Optional CA certificate path for the AMQP
+                broker
+            verify_ssl (bool): Whether RGW verifies the AMQP broker's TLS
+                certificate
 
         Returns:
             str: JSON-formatted response from the SNS API
         """
 
-        attributes = {
-            'amqp-exchange': exchange,
-            'amqp-ack-level': 'broker',
-            'use-ssl': 'true',
-            'verify-ssl': str(verify_ssl).lower()
-        }
+        attributes = _BASE_AMQP_ATTRS.copy()
+        attributes['amqp-exchange'] = exchange
+        attributes['verify-ssl'] = _BOOL_STR[bool(verify_ssl)]
 
         if ca_location:
             attributes['ca-location'] = ca_location
@@ -247,7 +700,14 @@ class CephNotificationMgr:
                 Name=topic_name,
                 Attributes=attributes
             )
+            self._topic_cache.pop(resp.get('TopicArn'))
+            self._topic_cache.pop(_TOPIC_LIST_KEY)
+            with self._arn_lock:
+                if self._arn_by_name is not None and resp.get('TopicArn'):
+                    self._arn_by_name[topic_name] = resp['TopicArn']
             return self._to_json(resp)
+        except ClientError as e:
+            return self._to_json(self._client_error(e))
         except Exception as e:
             return self._to_json({"error": str(e)})
 
@@ -266,7 +726,14 @@ class CephNotificationMgr:
         """
         try:
             resp = self.sns.delete_topic(TopicArn=topic_arn)
+            self._topic_cache.pop(topic_arn)
+            self._topic_cache.pop(_TOPIC_LIST_KEY)
+            with self._arn_lock:
+                if self._arn_by_name is not None:
+                    self._arn_by_name.pop(topic_arn.rsplit(':', 1)[-1], None)
             return self._to_json(resp)
+        except ClientError as e:
+            return self._to_json(self._client_error(e))
         except Exception as e:
             return self._to_json({"error": str(e)})
 
@@ -290,6 +757,8 @@ class CephNotificationMgr:
                 ExpectedBucketOwner=owner
             )
             return self._to_json(resp)
+        except ClientError as e:
+            return self._to_json(self._client_error(e))
         except Exception as e:
             return self._to_json({"error": str(e)})
 
@@ -303,11 +772,37 @@ class CephNotificationMgr:
         This configures the bucket to emit object create and delete events
         to the specified topic.
 
+        Note that this replaces the bucket's entire notification
+        configuration; use create_notifications() to install several rules
+        on the same bucket.
+
         Parameters:
             bucket (str): Bucket name
             topic_arn (str): ARN of the notification topic
             notification_id (str): Identifier for the notification rule
 
+        Returns:
+            str: JSON-formatted response
+        """
+        return self.create_notifications(
+            bucket, [NotificationRule(notification_id, topic_arn)])
+
+    # --------------------------------------------------------
+    # CREATE MULTIPLE NOTIFICATIONS
+    # --------------------------------------------------------
+    def create_notifications(self, bucket, rules):
+        """
+        Create several bucket notification rules in a single request.
+
+        The bucket's notification configuration is replaced with the given
+        rules in one PUT, rather than one PUT per rule (where each PUT would
+        overwrite the previous one).
+
+        Parameters:
+            bucket (str): Bucket name
+            rules (list): NotificationRule objects (plain dicts with 'Id',
+                'TopicArn' and 'Events' keys are also accepted)
+
         Returns:
             str: JSON-formatted response
         """
@@ -315,13 +810,11 @@ class CephNotificationMgr:
         bucket_notifications_configuration = {
             'TopicConfigurations': [
                 {
-                    'Id': notification_id,
-                    'TopicArn': topic_arn,
-                    'Events': [
-                        's3:ObjectCreated:*',
-                        's3:ObjectRemoved:*'
-                    ]
-                }
+                    'Id': r.id,
+                    'TopicArn': r.topic_arn,
+                    'Events': list(r.events)
+                } if isinstance(r, NotificationRule) else r
+                for r in rules
             ]
         }
 
@@ -331,6 +824,8 @@ class CephNotificationMgr:
                 NotificationConfiguration=bucket_notifications_configuration
             )
             return self._to_json(resp)
+        except ClientError as e:
+            return self._to_json(self._client_error(e))
         except Exception as e:
             return self._to_json({"error": str(e)})
 
@@ -342,20 +837,153 @@ class CephNotificationMgr:
         Remove all notification rules from a bucket.
 
         This is accomplished by submitting an empty notification
-        configuration to the S3 API.
+        configuration to the S3 API. The current configuration is read
+        first, and the update is skipped if the bucket has no rules. The
+        read is best-effort: if it fails (e.g. owner mismatch or missing
+        read permission) the empty configuration is submitted anyway.
 
         Parameters:
             bucket (str): Bucket name
             owner (str): Expected bucket owner ID
 
         Returns:
-            str: JSON-formatted response
+            str: JSON-formatted response ({"skipped": true} if the bucket
+                 had no notification rules)
         """
+        try:
+            cur = self.s3.get_bucket_notification_configuration(
+                Bucket=bucket,
+                ExpectedBucketOwner=owner
+            )
+        except Exception:
+            cur = None
+
+        if (cur is not None and _NOTIF_EVENTBRIDGE_KEY not in cur and
+                not any(cur.get(k) for k in _NOTIF_CONFIG_KEYS)):
+            return self._to_json({'skipped': True})
+
         try:
             resp = self.s3.put_bucket_notification_configuration(
                 Bucket=bucket,
                 NotificationConfiguration={}
             )
             return self._to_json(resp)
+        except ClientError as e:
+            return self._to_json(self._client_error(e))
         except Exception as e:
             return self._to_json({"error": str(e)})
+
+    # --------------------------------------------------------
+    # Helper: Apply a per-bucket method across a thread pool
+    # --------------------------------------------------------
+    def _run_bulk(self, method, buckets_owners, max_workers):
+        """
+        Call method(bucket, owner) for every pair using a thread pool.
+
+        The worker count is capped at the client connection pool size so
+        threads never queue waiting for a connection.
+
+        Parameters:
+            method (callable): Bound per-bucket method to call
+            buckets_owners (iterable): (bucket, owner) pairs
+            max_workers (int): Requested number of concurrent requests
+
+        Returns:
+            list: Results in input order
+
+        Raises:
+            ValueError: If max_workers is not a positive integer. This is a
+                usage error rather than an API failure, so it is raised
+                instead of being returned as JSON.
+        """
+        if (isinstance(max_workers, bool) or
+                not isinstance(max_workers, int) or max_workers < 1):
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers!r}")
+
+        max_workers = min(max_workers, _MAX_POOL_CONNECTIONS)
+        with ThreadPoolExecutor(max_workers) as ex:
+            return list(ex.map(lambda bo: method(*bo), buckets_owners))
+
+    # --------------------------------------------------------
+    # BULK: LIST NOTIFICATIONS FOR MANY BUCKETS
+    # --------------------------------------------------------
+    def list_notifications_bulk(self, buckets_owners,
+                                max_workers=_BULK_MAX_WORKERS):
+        """
+        Retrieve notification configuration for many buckets in parallel.
+
+        Requests are fanned out over a thread pool, so wall time is roughly
+        one round-trip per batch of max_workers buckets rather than one per
+        bucket.
+
+        Parameters:
+            buckets_owners (iterable): (bucket, owner) pairs
+            max_workers (int): Maximum number of concurrent requests,
+                capped at _MAX_POOL_CONNECTIONS (20)
+
+        Returns:
+            list: JSON-formatted results, in the same order as the input
+
+        Raises:
+            ValueError: If max_workers is not a positive integer
+        """
+        return self._run_bulk(self.list_notifications, buckets_owners,
+                              max_workers)
+
+    # --------------------------------------------------------
+    # BULK: DELETE NOTIFICATIONS FROM MANY BUCKETS
+    # --------------------------------------------------------
+    def delete_notifications_bulk(self, buckets_owners,
+                                  max_workers=_BULK_MAX_WORKERS):
+        """
+        Remove all notification rules from many buckets in parallel.
+
+        Parameters:
+            buckets_owners (iterable): (bucket, owner) pairs
+            max_workers (int): Maximum number of concurrent requests,
+                capped at _MAX_POOL_CONNECTIONS (20)
+
+        Returns:
+            list: JSON-formatted results, in the same order as the input
+
+        Raises:
+            ValueError: If max_workers is not a positive integer
+        """
+        return self._run_bulk(self.delete_notifications, buckets_owners,
+                              max_workers)
+
+
+# ------------------------------------------------------------
+# Shared manager instances
+# ------------------------------------------------------------
+_MGR_CACHE = {}
+_MGR_LOCK = threading.Lock()
+
+
+def get_manager(**kwargs):
+    """
+    Return a shared CephNotificationMgr for the given configuration.
+
+    Managers are cached per distinct set of keyword arguments, so
+    long-running services and per-request handlers can call this freely
+    instead of constructing a new manager each time. The underlying boto3
+    clients are thread-safe for API calls and the manager's caches are
+    lock-protected, so one shared instance is preferred over one per
+    thread.
+
+    Parameters:
+        **kwargs: Arguments accepted by CephNotificationMgr
+
+    Returns:
+        CephNotificationMgr: Cached manager instance
+    """
+    key = tuple(sorted(kwargs.items()))
+    mgr = _MGR_CACHE.get(key)
+    if mgr is None:
+        with _MGR_LOCK:
+            mgr = _MGR_CACHE.get(key)
+            if mgr is None:
+                mgr = CephNotificationMgr(**kwargs)
+                _MGR_CACHE[key] = mgr
+    return mgr
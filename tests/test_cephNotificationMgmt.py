@@ -0,0 +1,374 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cephNotificationMgmt as cnm  # noqa: E402
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    class ClientError(Exception):
+        """Stand-in for botocore's ClientError when botocore is absent."""
+
+        def __init__(self, error_response, operation_name):
+            super().__init__(f"{operation_name}: {error_response}")
+            self.response = error_response
+            self.operation_name = operation_name
+
+
+def client_error(code, status, op='Operation'):
+    return ClientError({
+        'Error': {'Code': code, 'Message': code + ' message'},
+        'ResponseMetadata': {'HTTPStatusCode': status}
+    }, op)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakePaginator:
+    def __init__(self, sns):
+        self.sns = sns
+
+    def paginate(self):
+        self.sns.calls.append('list_topics')
+        if self.sns.fail_listing:
+            raise client_error('AccessDenied', 403, 'ListTopics')
+        arns = list(self.sns.topics.values())
+        # Two pages, to exercise aggregation
+        return [{'Topics': [{'TopicArn': a} for a in arns[:1]]},
+                {'Topics': [{'TopicArn': a} for a in arns[1:]]}]
+
+
+class FakeSNS:
+    def __init__(self, names=()):
+        self.calls = []
+        self.fail_listing = False
+        self.topics = {n: self._arn(n) for n in names}
+
+    @staticmethod
+    def _arn(name):
+        return 'arn:aws:sns:default::' + name
+
+    def get_paginator(self, op):
+        assert op == 'list_topics'
+        return FakePaginator(self)
+
+    def get_topic_attributes(self, TopicArn):
+        self.calls.append(('get_topic_attributes', TopicArn))
+        if TopicArn not in self.topics.values():
+            raise client_error('NotFound', 404, 'GetTopicAttributes')
+        return {'Attributes': {'TopicArn': TopicArn, 'Name': 'orig'}}
+
+    def create_topic(self, Name, Attributes):
+        self.calls.append(('create_topic', Name))
+        self.topics[Name] = self._arn(Name)
+        return {'TopicArn': self.topics[Name]}
+
+    def delete_topic(self, TopicArn):
+        self.calls.append(('delete_topic', TopicArn))
+        self.topics = {n: a for n, a in self.topics.items() if a != TopicArn}
+        return {}
+
+
+class FakeS3:
+    def __init__(self, configs=None, get_error=None):
+        self.calls = []
+        self.configs = configs or {}
+        self.get_error = get_error
+
+    def get_bucket_notification_configuration(self, Bucket,
+                                              ExpectedBucketOwner):
+        self.calls.append(('get', Bucket))
+        if self.get_error is not None:
+            raise self.get_error
+        return dict(self.configs.get(Bucket, {}))
+
+    def put_bucket_notification_configuration(self, Bucket,
+                                              NotificationConfiguration):
+        self.calls.append(('put', Bucket, NotificationConfiguration))
+        return {'ResponseMetadata': {'HTTPStatusCode': 200}}
+
+    def list_buckets(self):
+        raise client_error('AccessDenied', 403, 'ListBuckets')
+
+
+def make_mgr(s3=None, sns=None, **kwargs):
+    s3 = s3 if s3 is not None else FakeS3()
+    sns = sns if sns is not None else FakeSNS()
+    with mock.patch.object(cnm, '_lazy_import'), \
+            mock.patch.object(cnm, '_build_clients', return_value=(s3, sns)):
+        return cnm.CephNotificationMgr(endpoint='http://rgw', **kwargs)
+
+
+class BaseTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(cnm, 'ClientError', ClientError)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.clock = FakeClock()
+        patcher = mock.patch.object(cnm.time, 'monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestTTLCache(BaseTestCase):
+    def test_entries_expire_after_ttl(self):
+        cache = cnm._TTLCache(maxsize=4, ttl=10)
+        cache.set('a', 1)
+        self.clock.now += 9.9
+        self.assertEqual(cache.get('a'), 1)
+        self.clock.now += 0.2
+        self.assertIsNone(cache.get('a'))
+
+    def test_oldest_entry_is_evicted_when_full(self):
+        cache = cnm._TTLCache(maxsize=2, ttl=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_concurrent_sets_do_not_raise(self):
+        cache = cnm._TTLCache(maxsize=4, ttl=10)
+        errors = []
+
+        def worker(i):
+            try:
+                for j in range(2000):
+                    cache.set((i, j), j)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+
+class TestTopicCache(BaseTestCase):
+    def test_get_topic_is_cached(self):
+        sns = FakeSNS(['t1'])
+        mgr = make_mgr(sns=sns)
+        arn = sns.topics['t1']
+
+        first = json.loads(mgr.get_topic(arn))
+        second = json.loads(mgr.get_topic(arn))
+
+        self.assertEqual(first, second)
+        self.assertEqual(sns.calls.count(('get_topic_attributes', arn)), 1)
+
+        self.clock.now += cnm._TOPIC_CACHE_TTL + 1
+        mgr.get_topic(arn)
+        self.assertEqual(sns.calls.count(('get_topic_attributes', arn)), 2)
+
+    def test_raw_results_do_not_alias_cache(self):
+        sns = FakeSNS(['t1'])
+        mgr = make_mgr(sns=sns, return_raw=True)
+        arn = sns.topics['t1']
+
+        mgr.get_topic(arn)['Attributes']['Name'] = 'MUTATED'
+        mgr.list_topics()['Topics'][0]['TopicArn'] = 'MUTATED'
+
+        self.assertEqual(mgr.get_topic(arn)['Attributes']['Name'], 'orig')
+        self.assertEqual(mgr.list_topics()['Topics'][0]['TopicArn'], arn)
+
+    def test_list_topics_aggregates_pages_and_is_cached(self):
+        sns = FakeSNS(['t1', 't2', 't3'])
+        mgr = make_mgr(sns=sns, return_raw=True)
+
+        topics = mgr.list_topics()['Topics']
+        mgr.list_topics()
+
+        self.assertEqual([t['TopicArn'] for t in topics],
+                         list(sns.topics.values()))
+        self.assertEqual(sns.calls.count('list_topics'), 1)
+
+    def test_create_amqp_topic_invalidates_cache(self):
+        sns = FakeSNS(['t1'])
+        mgr = make_mgr(sns=sns, return_raw=True)
+        mgr.list_topics()
+
+        mgr.create_amqp_topic('ex', 't2', 'broker:5672/vhost')
+
+        topics = mgr.list_topics()['Topics']
+        self.assertIn(sns.topics['t2'], [t['TopicArn'] for t in topics])
+        self.assertEqual(sns.calls.count('list_topics'), 2)
+
+    def test_delete_topic_invalidates_cache(self):
+        sns = FakeSNS(['t1', 't2'])
+        mgr = make_mgr(sns=sns, return_raw=True)
+        arn = sns.topics['t1']
+        mgr.get_topic(arn)
+        mgr.list_topics()
+
+        mgr.delete_topic(arn)
+
+        self.assertEqual(mgr.get_topic(arn)['http_status'], 404)
+        self.assertNotIn(arn, [t['TopicArn']
+                               for t in mgr.list_topics()['Topics']])
+        self.assertEqual(sns.calls.count('list_topics'), 2)
+
+
+class TestTopicArn(BaseTestCase):
+    def test_lookup_uses_cached_map(self):
+        sns = FakeSNS(['t1', 't2'])
+        mgr = make_mgr(sns=sns)
+
+        self.assertEqual(mgr.topic_arn('t1'), sns.topics['t1'])
+        self.assertEqual(mgr.topic_arn('t2'), sns.topics['t2'])
+        self.assertEqual(sns.calls.count('list_topics'), 1)
+
+    def test_misses_reload_at_most_once_per_ttl(self):
+        sns = FakeSNS(['t1'])
+        mgr = make_mgr(sns=sns)
+        mgr.topic_arn('t1')
+
+        for name in ('x', 'y', 'z'):
+            self.assertIsNone(mgr.topic_arn(name))
+        self.assertEqual(sns.calls.count('list_topics'), 1)
+
+        sns.topics['x'] = sns._arn('x')
+        self.clock.now += cnm._TOPIC_CACHE_TTL
+        self.assertEqual(mgr.topic_arn('x'), sns.topics['x'])
+        self.assertEqual(sns.calls.count('list_topics'), 2)
+
+    def test_create_and_delete_update_map(self):
+        sns = FakeSNS(['t1'])
+        mgr = make_mgr(sns=sns)
+        mgr.topic_arn('t1')
+
+        mgr.create_amqp_topic('ex', 't2', 'broker:5672/vhost')
+        self.assertEqual(mgr.topic_arn('t2'), sns.topics['t2'])
+
+        mgr.delete_topic(sns.topics['t1'])
+        self.assertIsNone(mgr.topic_arn('t1'))
+        self.assertEqual(sns.calls.count('list_topics'), 1)
+
+    def test_listing_failure_returns_none_and_logs(self):
+        sns = FakeSNS(['t1'])
+        sns.fail_listing = True
+        mgr = make_mgr(sns=sns)
+
+        with self.assertLogs(cnm.log, 'ERROR') as logs:
+            self.assertIsNone(mgr.topic_arn('t1'))
+        self.assertIn('AccessDenied', logs.output[0])
+
+
+class TestDeleteNotifications(BaseTestCase):
+    def test_empty_configuration_is_skipped(self):
+        s3 = FakeS3({'b': {'ResponseMetadata': {'HTTPStatusCode': 200}}})
+        mgr = make_mgr(s3=s3, return_raw=True)
+
+        self.assertEqual(mgr.delete_notifications('b', 'owner'),
+                         {'skipped': True})
+        self.assertEqual([c[0] for c in s3.calls], ['get'])
+
+    def test_existing_rules_are_cleared(self):
+        s3 = FakeS3({'b': {'TopicConfigurations': [{'Id': 'n1'}]}})
+        mgr = make_mgr(s3=s3, return_raw=True)
+
+        mgr.delete_notifications('b', 'owner')
+        self.assertEqual(s3.calls[-1], ('put', 'b', {}))
+
+    def test_eventbridge_only_is_cleared(self):
+        s3 = FakeS3({'b': {'EventBridgeConfiguration': {}}})
+        mgr = make_mgr(s3=s3, return_raw=True)
+
+        mgr.delete_notifications('b', 'owner')
+        self.assertEqual(s3.calls[-1], ('put', 'b', {}))
+
+    def test_probe_failure_falls_through_to_put(self):
+        s3 = FakeS3(get_error=client_error('AccessDenied', 403))
+        mgr = make_mgr(s3=s3, return_raw=True)
+
+        resp = mgr.delete_notifications('b', '')
+        self.assertEqual(s3.calls[-1], ('put', 'b', {}))
+        self.assertEqual(resp['ResponseMetadata']['HTTPStatusCode'], 200)
+
+
+class TestBulk(BaseTestCase):
+    def test_results_keep_input_order(self):
+        mgr = make_mgr()
+        pairs = [(f'bucket-{i}', 'owner') for i in range(40)]
+
+        def slow_list(bucket, owner):
+            time.sleep(random.random() / 100)
+            return bucket
+
+        mgr.list_notifications = slow_list
+        self.assertEqual(mgr.list_notifications_bulk(pairs, max_workers=50),
+                         [b for b, _ in pairs])
+
+    def test_delete_bulk_keeps_input_order(self):
+        configs = {f'b{i}': {'TopicConfigurations': [{'Id': 'n'}]}
+                   for i in range(0, 10, 2)}
+        mgr = make_mgr(s3=FakeS3(configs), return_raw=True)
+        pairs = [(f'b{i}', 'owner') for i in range(10)]
+
+        results = mgr.delete_notifications_bulk(pairs, max_workers=4)
+        self.assertEqual([r == {'skipped': True} for r in results],
+                         [i % 2 == 1 for i in range(10)])
+
+    def test_invalid_max_workers_raises(self):
+        mgr = make_mgr()
+        for bad in (0, -1, True, 2.0, None):
+            with self.assertRaises(ValueError):
+                mgr.list_notifications_bulk([('b', 'o')], max_workers=bad)
+
+
+class TestErrors(BaseTestCase):
+    def test_client_error_shape(self):
+        mgr = make_mgr()
+        resp = json.loads(mgr.list_buckets())
+        self.assertEqual(resp, {
+            'error': {'Code': 'AccessDenied',
+                      'Message': 'AccessDenied message'},
+            'http_status': 403
+        })
+
+    def test_other_errors_are_stringified(self):
+        s3 = FakeS3()
+        s3.list_buckets = mock.Mock(side_effect=RuntimeError('boom'))
+        mgr = make_mgr(s3=s3, return_raw=True)
+        self.assertEqual(mgr.list_buckets(), {'error': 'boom'})
+
+
+class TestGetManager(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(cnm._MGR_CACHE, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_config_returns_same_instance(self):
+        with mock.patch.object(cnm, 'CephNotificationMgr',
+                               side_effect=lambda **kw: object()) as cls:
+            a = cnm.get_manager(endpoint='http://rgw', aws_profile='p')
+            b = cnm.get_manager(aws_profile='p', endpoint='http://rgw')
+            c = cnm.get_manager(endpoint='http://other', aws_profile='p')
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(cls.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()